@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from microapi.extension import Definition, PARAMETER_TYPE
+from microapi.serialization import render, serialization_plan
 
 
 @dataclass(frozen=True)
@@ -13,6 +14,7 @@ class TypeAggressiveDefinition(Definition):
 
         body = self.body
         parameter = self.parameter
+        serialization_plan(self.response.schema)
 
         def kernel(instance, *args, **kwargs):
             if body:
@@ -33,7 +35,7 @@ class TypeAggressiveDefinition(Definition):
                 )
 
             result = f(instance, *args, **kwargs)
-            return result.json(exclude_none=True)
+            return render(result)
 
         return Definition.__call__(self, kernel)
 
@@ -84,6 +84,12 @@ class AsyncDefinition(DefinitionSchema):
 
 
 def specification_from_endpoints(endpoints):
+    from microapi.validation import Issue, SpecificationError, validate_endpoints, validate_document
+
+    issues = validate_endpoints(endpoints)
+    if issues:
+        raise SpecificationError(issues)
+
     definitions = list(
         getattr(endpoint, operation_name).definition
         for endpoint in endpoints
@@ -98,11 +104,19 @@ def specification_from_endpoints(endpoints):
         all_schemas.add(definition.response.schema)
 
     schemas = schema(all_schemas, ref_prefix="#/components/schemas/")['definitions']
-    schemas_reverse_identifiers = dict(
-        (schema_definition['title'], schema_identifier)
-        for schema_identifier, schema_definition in schemas.items()
-    )
-    assert len(schemas_reverse_identifiers) == len(schemas), "Non unique schema titles"
+    schemas_reverse_identifiers = dict()
+    issues = list()
+    for schema_identifier, schema_definition in schemas.items():
+        title = schema_definition['title']
+        if title in schemas_reverse_identifiers:
+            issues.append(Issue(
+                '#/components/schemas',
+                f'schema title "{title}" is shared by '
+                f'{schemas_reverse_identifiers[title]} and {schema_identifier}'
+            ))
+        schemas_reverse_identifiers[title] = schema_identifier
+    if issues:
+        raise SpecificationError(issues)
 
     specification = APISpec(
         title="My dummy API (Change this title)",
@@ -183,4 +197,8 @@ def specification_from_endpoints(endpoints):
             ) if args else None
         )
 
+    issues = validate_document(specification.to_dict())
+    if issues:
+        raise SpecificationError(issues)
+
     return specification
@@ -0,0 +1,113 @@
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional, Type
+
+from pydantic import BaseModel, Extra
+from pydantic.json import pydantic_encoder
+from pydantic.utils import ROOT_KEY, sequence_like
+
+_ENCODER = json.JSONEncoder(default=pydantic_encoder)
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    name: str
+    head: str
+    tail: str
+
+
+@dataclass(frozen=True)
+class SerializationPlan:
+    """Flattened rendering of a model, equivalent to `.json(exclude_none=True)`.
+
+    Key fragments are encoded once per model and reused for every instance;
+    `None` values are skipped before anything gets encoded, so mostly empty
+    sub-objects (think of `Hyperlink`) cost one check per field.
+    When `fields` is `None`, the model is not plannable (custom root, extra or excluded fields)
+    and is rendered from its own `dict` instead; so are instances whose values do not match
+    the declared fields, as `construct` allows.
+    """
+    fields: Optional[tuple[FieldPlan, ...]]
+    names: frozenset = frozenset()
+
+    def write(self, model: BaseModel, out: list) -> None:
+        values = model.__dict__
+        if self.fields is None or values.keys() != self.names:
+            data = model.dict(exclude_none=True)
+            _write_value(data[ROOT_KEY] if model.__custom_root_type__ else data, out)
+            return
+
+        opened = False
+        for field in self.fields:
+            value = values[field.name]
+            if value is None:
+                continue
+            out.append(field.tail if opened else field.head)
+            _write_value(value, out)
+            opened = True
+        out.append('}' if opened else '{}')
+
+
+def _write_value(value: Any, out: list) -> None:
+    if isinstance(value, BaseModel):
+        serialization_plan(type(value)).write(value, out)
+    elif isinstance(value, dict):
+        opened = False
+        for key, item in value.items():
+            out.append(', ' if opened else '{')
+            out.append(_encode_key(key))
+            out.append(': ')
+            _write_value(item, out)
+            opened = True
+        out.append('}' if opened else '{}')
+    elif sequence_like(value):
+        opened = False
+        for item in value:
+            out.append(', ' if opened else '[')
+            _write_value(item, out)
+            opened = True
+        out.append(']' if opened else '[]')
+    else:
+        out.append(_ENCODER.encode(value))
+
+
+def _encode_key(key: Any) -> str:
+    if isinstance(key, str):
+        return _ENCODER.encode(key)
+    elif key is None or isinstance(key, (int, float)):
+        return _ENCODER.encode(_ENCODER.encode(key))
+    else:
+        raise TypeError(f'keys must be str, int, float, bool or None, not {type(key).__name__}')
+
+
+@lru_cache(maxsize=None)
+def serialization_plan(model: Type[BaseModel]) -> SerializationPlan:
+    if model.__custom_root_type__ or model.__config__.extra == Extra.allow \
+            or getattr(model, '__exclude_fields__', None) \
+            or getattr(model, '__include_fields__', None):
+        return SerializationPlan(fields=None)
+
+    fields = list()
+    for field in model.__fields__.values():
+        key = _ENCODER.encode(field.name) + ': '
+        fields.append(FieldPlan(
+            name=field.name,
+            head='{' + key,
+            tail=', ' + key
+        ))
+    return SerializationPlan(
+        fields=tuple(fields),
+        names=frozenset(model.__fields__.keys())
+    )
+
+
+def render(model: BaseModel) -> str:
+    """Renders a model the way `model.json(exclude_none=True)` would, in a single buffer."""
+    config = model.__config__
+    if config.json_encoders or config.json_dumps is not json.dumps:
+        return model.json(exclude_none=True)
+
+    out: list = list()
+    serialization_plan(type(model)).write(model, out)
+    return ''.join(out)
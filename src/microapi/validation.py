@@ -0,0 +1,233 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Optional, get_args
+
+from pydantic import BaseModel
+
+from microapi.extension import PARAMETER_TYPE
+
+_PLACEHOLDER = re.compile(r'{([^{}]+)}')
+_OPERATIONS = ('get', 'post')
+
+
+@dataclass(frozen=True)
+class Issue:
+    route: str
+    message: str
+    operation: Optional[str] = None
+
+    def __str__(self):
+        if self.operation:
+            return f'{self.operation.upper()} {self.route}: {self.message}'
+        return f'{self.route}: {self.message}'
+
+
+class SpecificationError(Exception):
+    def __init__(self, issues: list[Issue]):
+        super().__init__('\n'.join(str(issue) for issue in issues))
+        self.issues = issues
+
+
+@dataclass(frozen=True)
+class SchemaRecord:
+    name: str
+    title: Optional[str]
+    is_model: bool
+
+
+@dataclass(frozen=True)
+class OperationRecord:
+    name: str
+    summary: Any
+    status: Any
+    response: Optional[SchemaRecord]
+    body: Optional[SchemaRecord]
+    parameters: tuple[tuple[Any, Any], ...]
+
+
+@dataclass(frozen=True)
+class EndpointRecord:
+    """Plain snapshot of an endpoint, so that lints do not depend on the view classes."""
+    route: Any
+    args: tuple[tuple[Any, Any], ...]
+    operations: tuple[OperationRecord, ...]
+
+
+def _schema_record(schema) -> SchemaRecord:
+    is_model = isinstance(schema, type) and issubclass(schema, BaseModel)
+    return SchemaRecord(
+        name=f'{schema.__module__}.{schema.__qualname__}' if isinstance(schema, type) else repr(schema),
+        title=getattr(schema.__config__, 'title', None) if is_model else None,
+        is_model=is_model
+    )
+
+
+def endpoint_record(endpoint) -> EndpointRecord:
+    route, args = endpoint.route(_split=True)
+
+    operations = list()
+    for operation_name in _OPERATIONS:
+        if not hasattr(endpoint, operation_name):
+            continue
+        definition = getattr(getattr(endpoint, operation_name), 'definition', None)
+        if definition is None:
+            operations.append(OperationRecord(
+                name=operation_name, summary=None, status=None,
+                response=None, body=None, parameters=tuple()
+            ))
+            continue
+        response = definition.response
+        operations.append(OperationRecord(
+            name=operation_name,
+            summary=definition.summary,
+            status=response.status,
+            response=_schema_record(response.schema),
+            body=_schema_record(definition.body.schema) if definition.body else None,
+            parameters=tuple(
+                (param.name, param.schema)
+                for param in (definition.parameter or list())
+                if param
+            )
+        ))
+
+    return EndpointRecord(
+        route=route,
+        args=tuple((args or dict()).items()),
+        operations=tuple(operations)
+    )
+
+
+def lint_endpoint(record: EndpointRecord) -> tuple[Issue, ...]:
+    parameter_types = get_args(PARAMETER_TYPE)
+    route = str(record.route)
+    issues = list()
+
+    if not isinstance(record.route, str) or not record.route.startswith('/'):
+        issues.append(Issue(route, 'route must be a string starting with "/"'))
+
+    placeholders = _PLACEHOLDER.findall(route)
+    args = dict(record.args)
+    for placeholder in placeholders:
+        if placeholder not in args:
+            issues.append(Issue(route, f'path placeholder "{placeholder}" is missing from route(_split=True)'))
+    for arg_name, arg_type in record.args:
+        if arg_name not in placeholders:
+            issues.append(Issue(route, f'path argument "{arg_name}" does not appear in the route'))
+        if arg_type not in parameter_types:
+            issues.append(Issue(route, f'path argument "{arg_name}" has unknown type {arg_type!r}'))
+    if len(placeholders) != len(set(placeholders)):
+        issues.append(Issue(route, 'route repeats a path placeholder'))
+
+    if not record.operations:
+        issues.append(Issue(route, 'endpoint defines no operation'))
+
+    for operation in record.operations:
+        def report(message):
+            issues.append(Issue(route, message, operation.name))
+
+        if operation.response is None:
+            report('operation is not annotated with a definition')
+            continue
+        if not operation.summary:
+            report('summary is empty')
+        if not isinstance(operation.status, int) or not 100 <= operation.status <= 599:
+            report(f'response status {operation.status!r} is not an HTTP status code')
+
+        for role, schema in (('response', operation.response), ('body', operation.body)):
+            if schema is None:
+                continue
+            if not schema.is_model:
+                report(f'{role} schema {schema.name} is not a pydantic model')
+            elif not schema.title:
+                report(f'{role} schema {schema.name} has no Config.title')
+
+        seen = set()
+        for name, param_type in operation.parameters:
+            if param_type not in parameter_types:
+                report(f'parameter "{name}" has unknown type {param_type!r}')
+            if name in seen:
+                report(f'parameter "{name}" is declared twice')
+            if name in args:
+                report(f'parameter "{name}" shadows a path argument')
+            seen.add(name)
+
+    return tuple(issues)
+
+
+def _lint_across_records(records: list[EndpointRecord]) -> list[Issue]:
+    issues = list()
+
+    routes = dict()
+    titles = dict()
+    for record in records:
+        route = str(record.route)
+        if route in routes:
+            issues.append(Issue(route, 'route is registered by more than one endpoint'))
+        routes[route] = record
+        for operation in record.operations:
+            for schema in (operation.response, operation.body):
+                if schema is None or not schema.title:
+                    continue
+                names = titles.setdefault(schema.title, set())
+                names.add(schema.name)
+                if len(names) == 2:
+                    issues.append(Issue(route, f'schema title "{schema.title}" is shared by {sorted(names)}', operation.name))
+
+    return issues
+
+
+def validate_endpoints(endpoints) -> list[Issue]:
+    """Lints the definitions of the endpoints, before any schema generation."""
+    records = list(endpoint_record(endpoint) for endpoint in endpoints)
+
+    issues = list()
+    for record in records:
+        issues.extend(lint_endpoint(record))
+    issues.extend(_lint_across_records(records))
+    return issues
+
+
+def _references(node):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == '$ref' and isinstance(value, str):
+                yield value
+            else:
+                yield from _references(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _references(value)
+
+
+def validate_document(document: dict) -> list[Issue]:
+    """Checks the generated document: references resolve, and path placeholders are declared."""
+    issues = list()
+
+    for reference in set(_references(document)):
+        node = document
+        if reference.startswith('#/'):
+            for part in reference[2:].split('/'):
+                node = node.get(part) if isinstance(node, dict) else None
+        else:
+            node = None
+        if node is None:
+            issues.append(Issue('#', f'reference "{reference}" does not resolve'))
+
+    for route, path_item in document.get('paths', dict()).items():
+        declared = set(
+            parameter.get('name')
+            for parameter in path_item.get('parameters', list())
+            if parameter.get('in') == 'path'
+        )
+        for placeholder in _PLACEHOLDER.findall(route):
+            if placeholder not in declared:
+                issues.append(Issue(route, f'path placeholder "{placeholder}" is not declared as a parameter'))
+        for parameter in path_item.get('parameters', list()):
+            if 'schema' in parameter and not parameter['schema']:
+                issues.append(Issue(route, f'parameter "{parameter.get("name")}" has no schema'))
+        for operation_name in _OPERATIONS:
+            for parameter in path_item.get(operation_name, dict()).get('parameters', list()):
+                if 'schema' in parameter and not parameter['schema']:
+                    issues.append(Issue(route, f'parameter "{parameter.get("name")}" has no schema', operation_name))
+
+    return issues